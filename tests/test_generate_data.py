@@ -0,0 +1,246 @@
+"""DB-free checks for the data generator's pure-Python models"""
+
+import argparse
+import os
+import random
+import sys
+import unittest
+from array import array
+from collections import Counter
+from datetime import datetime, timedelta
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import generate_data  # noqa: E402
+from generate_data import AdaptiveBatchController, CustomerActivityModel  # noqa: E402
+
+
+def synthetic_latency(batch_size, optimum=2000):
+    """Per-batch latency with fixed overhead, per-row cost and a penalty past the optimum"""
+    return 0.05 + batch_size * 0.0001 + max(0, batch_size - optimum) ** 2 * 1e-7
+
+
+class AdaptiveBatchControllerTest(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(1234)
+        # Silence the controller's progress logging
+        patcher = mock.patch.object(generate_data, 'print', create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def feed(self, controller, batches, noise=0.03):
+        for _ in range(batches):
+            size = controller.batch_size
+            controller.record_write(size, synthetic_latency(size) * random.uniform(1 - noise, 1 + noise))
+
+    def test_converges_within_bounds(self):
+        controller = AdaptiveBatchController(1, min_batch_size=100, max_batch_size=5000)
+        self.feed(controller, 300)
+
+        self.assertIsNotNone(controller._settled_rate)
+        self.assertGreaterEqual(controller.batch_size, 100)
+        self.assertLessEqual(controller.batch_size, 5000)
+        # Throughput peaks around 2,000 rows per batch
+        self.assertTrue(1200 <= controller.batch_size <= 3000, controller.batch_size)
+
+    def test_respects_tight_bounds(self):
+        controller = AdaptiveBatchController(1, min_batch_size=100, max_batch_size=800)
+        for _ in range(300):
+            self.feed(controller, 1)
+            self.assertTrue(100 <= controller.batch_size <= 800, controller.batch_size)
+
+    def test_single_noisy_window_does_not_retune(self):
+        controller = AdaptiveBatchController(1)
+        self.feed(controller, 300)
+        settled_size = controller.batch_size
+        self.assertIsNotNone(controller._settled_rate)
+
+        # One window three times slower than usual
+        for _ in range(AdaptiveBatchController.WINDOW):
+            controller.record_write(settled_size, synthetic_latency(settled_size) * 3)
+        self.feed(controller, AdaptiveBatchController.WINDOW * 5, noise=0.0)
+
+        self.assertIsNotNone(controller._settled_rate)
+        self.assertEqual(controller.batch_size, settled_size)
+
+    def test_sustained_slowdown_retunes(self):
+        controller = AdaptiveBatchController(1)
+        self.feed(controller, 300)
+        settled_size = controller.batch_size
+
+        for _ in range(AdaptiveBatchController.WINDOW * AdaptiveBatchController.RETUNE_WINDOWS):
+            controller.record_write(settled_size, synthetic_latency(settled_size) * 3)
+
+        self.assertIsNone(controller._settled_rate)
+
+    def test_auto_size_is_capped_at_daily_volume(self):
+        controller = AdaptiveBatchController(1, max_batch_size=5000)
+        controller.limit_to_daily_volume(2700)
+
+        # Latency keeps falling per row, so the climb runs into the upper bound
+        for _ in range(200):
+            size = controller.batch_size
+            controller.record_write(size, 0.5 + size * 0.00001)
+            self.assertLessEqual(controller.batch_size, 2700)
+        self.assertIn(f"~{controller.batch_size:,} sales per batch written", controller.settings())
+
+    def test_settings_report_rows_actually_written(self):
+        controller = AdaptiveBatchController(1, batch_size=5000)
+        controller.limit_to_daily_volume(2700, whole_days=True)
+        for rows in (2600, 2700, 2800):
+            controller.record_write(rows, 0.5)
+
+        self.assertEqual(controller.batch_size, 5000)
+        self.assertIn("page size 5000", controller.settings())
+        self.assertIn("~2,700 sales per batch written", controller.settings())
+
+    def test_fixed_settings_are_kept(self):
+        controller = AdaptiveBatchController(1, batch_size=750, commit_every=4)
+        self.feed(controller, 60)
+        controller.record_commit(10.0)
+
+        self.assertEqual(controller.batch_size, 750)
+        self.assertEqual(controller.batches_per_commit, 4)
+
+
+class CustomerActivityModelTest(unittest.TestCase):
+
+    CHANNEL_WEIGHTS = [c[2] for c in generate_data.CHANNELS]
+
+    def setUp(self):
+        random.seed(4321)
+
+    def simulate(self, num_customers=10000, num_days=181):
+        """Run the default daily volume through the model, returns purchase days per customer"""
+        expected = generate_data.DAILY_SALES_MEAN * sum(generate_data.WEEKDAY_MULT) / 7
+        # Registrations spread over the last 720 days, like generate_customers
+        self.first_days = array('H', (max(0, num_days - random.randint(0, 720)) for _ in range(num_customers)))
+        model = CustomerActivityModel(
+            array('i', range(1, num_customers + 1)), 50, self.CHANNEL_WEIGHTS, num_days, expected,
+            self.first_days
+        )
+        purchase_days = Counter()
+        for day in range(num_days):
+            daily_sales = int(random.gauss(generate_data.DAILY_SALES_MEAN, generate_data.DAILY_SALES_STDDEV)
+                              * generate_data.WEEKDAY_MULT[day % 7])
+            buyers = model.sample_day(day, daily_sales)
+            identified = [c for c in buyers if c is not None]
+            self.assertEqual(len(buyers), daily_sales)
+            self.assertEqual(len(set(identified)), len(identified), f"repeat buyer on day {day}")
+            self.assertTrue(all(self.first_days[c] <= day for c in identified), f"early buyer on day {day}")
+            purchase_days.update(identified)
+        return model, purchase_days
+
+    def test_identified_share_matches_target(self):
+        model, _ = self.simulate()
+        self.assertAlmostEqual(model.identified_share, CustomerActivityModel.IDENTIFIED_SHARE, delta=0.02)
+
+    def test_heaviest_customers_do_not_dominate(self):
+        _, purchase_days = self.simulate()
+        self.assertLess(max(purchase_days.values()), 181 * 0.6)
+        # Top 1% of customers stay a small slice of identified sales
+        top = sum(count for _, count in purchase_days.most_common(100))
+        self.assertLess(top / sum(purchase_days.values()), 0.05)
+
+    def test_late_registrations_start_buying_after_signup(self):
+        _, purchase_days = self.simulate()
+        late = [c for c, first in enumerate(self.first_days) if 0 < first < 150]
+        self.assertGreater(len(late), 1000)
+        self.assertGreater(sum(1 for c in late if purchase_days[c]) / len(late), 0.8)
+
+    def test_few_customers_fall_back_to_anonymous(self):
+        model, purchase_days = self.simulate(num_customers=200, num_days=30)
+        self.assertLess(model.identified_share, CustomerActivityModel.IDENTIFIED_SHARE)
+        # Every eligible customer ends up buying on (nearly) every active day
+        active = [c for c, first in enumerate(self.first_days) if first == 0]
+        self.assertGreater(sum(purchase_days[c] for c in active) / len(active), 20)
+
+
+class ParseBrandSizesTest(unittest.TestCase):
+
+    DEFAULTS = {'stores': 50, 'products': 500, 'items': 200, 'customers': 10000, 'months': 6}
+
+    def test_applies_overrides_per_brand(self):
+        sizes = generate_data.parse_brand_sizes(
+            ['2:stores=10, customers=500', '3:months=1'], 3, self.DEFAULTS
+        )
+        self.assertEqual(sizes[0], self.DEFAULTS)
+        self.assertEqual(sizes[1], dict(self.DEFAULTS, stores=10, customers=500))
+        self.assertEqual(sizes[2], dict(self.DEFAULTS, months=1))
+
+    def test_allows_brand_without_customers(self):
+        sizes = generate_data.parse_brand_sizes(['1:customers=0'], 1, self.DEFAULTS)
+        self.assertEqual(sizes[0]['customers'], 0)
+
+    def test_rejects_invalid_specs(self):
+        for spec in ['3:stores=10', '0:stores=10', 'x:stores=10', '1:tables=10', '1:stores=ten',
+                     '1:stores=0', '1:stores=-5', '1:products=5', '1:months=0', '1']:
+            with self.subTest(spec=spec), self.assertRaises(argparse.ArgumentTypeError):
+                generate_data.parse_brand_sizes([spec], 2, self.DEFAULTS)
+
+    def test_rejects_invalid_defaults(self):
+        with self.assertRaises(argparse.ArgumentTypeError):
+            generate_data.parse_brand_sizes(None, 1, dict(self.DEFAULTS, stores=0))
+
+
+class GenerateSingleSaleCouponTest(unittest.TestCase):
+
+    SALE_TIME = datetime(2026, 3, 10, 12, 30, 0)
+    PRODUCTS = [{'id': i, 'name': f'p{i}', 'category': 'Burgers', 'base_price': 10.0 + i,
+                 'popularity': 0.5, 'has_customization': True} for i in range(20)]
+    ITEMS = [{'id': i, 'name': f'i{i}', 'price': 2.0 + i} for i in range(10)]
+    CHANNEL = {'id': 1, 'name': 'iFood', 'type': 'D', 'weight': 1.0}
+
+    def setUp(self):
+        random.seed(99)
+        generate_data.fake.seed_instance(99)
+
+    def coupon(self, discount_type, value, **overrides):
+        return dict({
+            'id': 1, 'discount_type': discount_type, 'discount_value': value, 'is_active': True,
+            'valid_from': self.SALE_TIME.replace(hour=0, minute=0), 'valid_until': None
+        }, **overrides)
+
+    def sales(self, coupons, count=3000):
+        return [generate_data.generate_single_sale(
+            self.SALE_TIME, 1, self.CHANNEL, None, self.PRODUCTS, self.ITEMS, [1, 2], coupons
+        ) for _ in range(count)]
+
+    def coupon_sales(self, coupons):
+        used = [s for s in self.sales(coupons) if s['coupon']]
+        self.assertGreater(len(used), 50)
+        for sale in used:
+            self.assertEqual(sale['status'], 'COMPLETED')
+            self.assertIn(sale['discount_reason'], generate_data.COUPON_REASONS)
+            self.assertEqual(sale['discount'], sale['coupon']['value'])
+        return used
+
+    def test_percentage_coupon(self):
+        for sale in self.coupon_sales([self.coupon('p', 20)]):
+            self.assertEqual(sale['discount'], round(sale['total_items_value'] * 0.2, 2))
+
+    def test_fixed_coupon(self):
+        for sale in self.coupon_sales([self.coupon('f', 10.0)]):
+            self.assertEqual(sale['discount'], round(min(10.0, sale['total_items_value'] * 0.5), 2))
+
+    def test_fixed_coupon_capped_at_half_the_items(self):
+        for sale in self.coupon_sales([self.coupon('f', 1000.0)]):
+            self.assertEqual(sale['discount'], round(sale['total_items_value'] * 0.5, 2))
+
+    def test_cancelled_sales_get_no_coupon_or_nested_items(self):
+        cancelled = [s for s in self.sales([self.coupon('p', 20)]) if s['status'] == 'CANCELLED']
+        self.assertGreater(len(cancelled), 50)
+        for sale in cancelled:
+            self.assertIsNone(sale['coupon'])
+            self.assertFalse([sub for p in sale['products'] for i in p['items'] for sub in i['items']])
+
+    def test_coupon_outside_window_is_not_used(self):
+        expired = self.coupon('p', 20, valid_until=self.SALE_TIME - timedelta(seconds=1))
+        not_started = self.coupon('p', 20, valid_from=self.SALE_TIME + timedelta(seconds=1))
+        self.assertFalse([s for s in self.sales([expired, not_started], count=500) if s['coupon']])
+
+
+if __name__ == '__main__':
+    unittest.main()